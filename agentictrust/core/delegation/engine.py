@@ -87,7 +87,7 @@ class DelegationEngine:
             DelegationAuditLog.log_event(grant_id=grant.grant_id, action="validation_failed", delegate_id=delegate_id, details={"reason": "expired"})
             raise ValueError("invalid_grant: expired")
         if requested_scopes:
-            if not set(requested_scopes).issubset(set(grant.scope)):
+            if not set(requested_scopes).issubset(grant.scope):
                 DelegationAuditLog.log_event(grant_id=grant.grant_id, action="validation_failed", delegate_id=delegate_id, details={"reason": "scope_exceeded"})
                 raise ValueError("invalid_scope")
         return grant 
\ No newline at end of file
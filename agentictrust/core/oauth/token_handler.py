@@ -359,7 +359,6 @@ class TokenHandler:
         launched_by: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Rotate refresh token and return new pair."""
-        from datetime import datetime
         try:
             old_token = IssuedToken.query.filter_by(
                 refresh_token_hash=refresh_token_raw
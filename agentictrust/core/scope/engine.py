@@ -1,8 +1,7 @@
 """
 Scope engine for managing and validating scopes.
 """
-from typing import List, Set, Dict, Any, Optional
-import traceback
+from typing import List, Set, Dict, Any, Optional, Tuple, Iterator
 import yaml
 from pathlib import Path
 
@@ -23,14 +22,14 @@ class ScopeEngine:
         # Determine the project root (parent of the 'app' directory)
         project_root = Path(__file__).resolve().parents[3]
         data_file = project_root / 'data' / 'scopes.yml'
-        logger.debug(f"Looking for scopes data file at {data_file}")
+        logger.debug("Looking for scopes data file at {}", data_file)
         
         # If not found, try legacy path inside app/data for backward-compatibility
         if not data_file.exists():
             alt_file = Path(__file__).resolve().parents[2] / 'data' / 'scopes.yml'
             if alt_file.exists():
                 data_file = alt_file
-                logger.debug(f"Using fallback scopes data file at {data_file}")
+                logger.debug("Using fallback scopes data file at {}", data_file)
 
         if not data_file.exists():
             logger.info(f"Scope data file not found at {data_file}, skipping initialization.")
@@ -49,7 +48,7 @@ class ScopeEngine:
                 init_db()
         except Exception as e:
             logger.warning(f"Could not verify or create 'scopes' table: {e}")
-            logger.debug(f"Exception details: {traceback.format_exc()}")
+            logger.opt(exception=e).debug("Exception details")
 
         # Load and process scopes from YAML
         try:
@@ -79,19 +78,19 @@ class ScopeEngine:
                         is_sensitive=entry.get('is_sensitive', False),
                         requires_approval=entry.get('requires_approval', False)
                     )
-                    logger.debug(f"Successfully created scope '{name}'")
+                    logger.debug("Successfully created scope '{}'", name)
                 except ValueError as ex:
                     logger.error(f"Validation error creating scope '{name}': {ex}")
                     continue
                 except Exception as ex:
                     logger.error(f"Error creating scope '{name}': {ex}")
-                    logger.debug(f"Exception details: {traceback.format_exc()}")
+                    logger.opt(exception=ex).debug("Exception details")
                     continue
                     
             logger.info("Scope initialization complete.")
         except Exception as e:
             logger.error(f"Failed to initialize scopes from YAML: {e}")
-            logger.debug(f"Exception details: {traceback.format_exc()}")
+            logger.opt(exception=e).debug("Exception details")
             # We don't re-raise the exception to avoid preventing app startup
 
     # Database-backed scope operations
@@ -133,7 +132,7 @@ class ScopeEngine:
             
             # Handle is_active separately since it's not part of Scope.create()
             if not is_active and scope:
-                logger.debug(f"Setting scope '{name}' as inactive")
+                logger.debug("Setting scope '{}' as inactive", name)
                 scope.update(is_active=is_active)
                 
             logger.info(f"Successfully created scope '{name}' (ID: {scope.scope_id})")
@@ -145,7 +144,7 @@ class ScopeEngine:
             raise
         except Exception as e:
             logger.error(f"Error creating scope '{name}': {e}")
-            logger.debug(f"Exception details: {traceback.format_exc()}")
+            logger.opt(exception=e).debug("Exception details")
             raise RuntimeError(f"Failed to create scope: {str(e)}") from e
 
     def list_scopes(self, level: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -156,15 +155,48 @@ class ScopeEngine:
             
             # Apply filter in memory if needed
             if level:
-                logger.debug(f"Filtering scopes by category: {level}")
+                logger.debug("Filtering scopes by category: {}", level)
                 scopes = [s for s in scopes if s.category == level]
                 
             result = [s.to_dict() for s in scopes]
-            logger.debug(f"Retrieved {len(result)} scopes" + (f" with category '{level}'" if level else ""))
+            if level:
+                logger.debug("Retrieved {} scopes with category '{}'", len(result), level)
+            else:
+                logger.debug("Retrieved {} scopes", len(result))
+            return result
+        except Exception as e:
+            logger.error(f"Error listing scopes: {e}")
+            logger.opt(exception=e).debug("Exception details")
+            raise RuntimeError(f"Failed to list scopes: {str(e)}") from e
+
+    def iter_scopes(self, level: Optional[str] = None, batch_size: int = 100) -> Iterator[Dict[str, Any]]:
+        """Yield scope dicts one at a time, loading rows batch_size at a time, optionally filtered by level"""
+        try:
+            query = Scope.query
+            if level:
+                logger.debug("Filtering scopes by category: {}", level)
+                query = query.filter_by(category=level)
+            for scope in query.yield_per(batch_size):
+                yield scope.to_dict()
+        except Exception as e:
+            logger.error(f"Error listing scopes: {e}")
+            logger.opt(exception=e).debug("Exception details")
+            raise RuntimeError(f"Failed to list scopes: {str(e)}") from e
+
+    def list_scopes_lite(self, fields: Tuple[str, ...] = ('scope_id', 'name')) -> List[Tuple[Any, ...]]:
+        """List all scopes as tuples of the requested fields, without building full dicts"""
+        unknown = [f for f in fields if f not in Scope.__table__.columns]
+        if unknown:
+            raise ValueError(f"Unknown scope fields: {', '.join(unknown)}")
+        try:
+            # Only select the requested columns instead of loading full Scope objects
+            columns = [getattr(Scope, f) for f in fields]
+            result = [tuple(row) for row in Scope.query.with_entities(*columns).all()]
+            logger.debug("Retrieved {} scopes ({})", len(result), fields)
             return result
         except Exception as e:
             logger.error(f"Error listing scopes: {e}")
-            logger.debug(f"Exception details: {traceback.format_exc()}")
+            logger.opt(exception=e).debug("Exception details")
             raise RuntimeError(f"Failed to list scopes: {str(e)}") from e
 
     def get_scope(self, scope_id: str) -> Dict[str, Any]:
@@ -172,14 +204,14 @@ class ScopeEngine:
         try:
             # Use the model method to get the scope by ID
             scope = Scope.get_by_id(scope_id)
-            logger.debug(f"Retrieved scope: {scope.name} (ID: {scope.scope_id})")
+            logger.debug("Retrieved scope: {} (ID: {})", scope.name, scope.scope_id)
             return scope.to_dict()
         except ValueError as e:
             # Re-raise ValueError from model method (e.g., scope not found)
             raise
         except Exception as e:
             logger.error(f"Error retrieving scope {scope_id}: {e}")
-            logger.debug(f"Exception details: {traceback.format_exc()}")
+            logger.opt(exception=e).debug("Exception details")
             raise RuntimeError(f"Failed to retrieve scope: {str(e)}") from e
 
     def update_scope(self, scope_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -191,7 +223,7 @@ class ScopeEngine:
                 
             # Validate name if included in update data
             if 'name' in data:
-                logger.debug(f"Validating updated scope name: {data['name']}")
+                logger.debug("Validating updated scope name: {}", data['name'])
                 validate_scope_name(data['name'])
                 
             # Get the scope by ID using the model method
@@ -206,7 +238,7 @@ class ScopeEngine:
             raise
         except Exception as e:
             logger.error(f"Error updating scope {scope_id}: {e}")
-            logger.debug(f"Exception details: {traceback.format_exc()}")
+            logger.opt(exception=e).debug("Exception details")
             raise RuntimeError(f"Failed to update scope: {str(e)}") from e
 
     def delete_scope(self, scope_id: str) -> None:
@@ -220,7 +252,7 @@ class ScopeEngine:
             raise
         except Exception as e:
             logger.error(f"Error deleting scope {scope_id}: {e}")
-            logger.debug(f"Exception details: {traceback.format_exc()}")
+            logger.opt(exception=e).debug("Exception details")
             raise RuntimeError(f"Failed to delete scope: {str(e)}") from e
 
     def expand(self, scopes: List[str]) -> Set[str]:
@@ -11,8 +11,8 @@ def expand_implied_scopes(scopes: List[str]) -> Set[str]:
     Given a list of scope names, return the set including implied scopes
     based on qualifiers and action hierarchy.
     """
-    # Load all registered scope names from DB
-    all_scope_names = [s.name for s in Scope.query.all()]
+    # Load all registered scope names from DB as a set for O(1) membership checks
+    all_scope_names = {name for (name,) in Scope.query.with_entities(Scope.name)}
     implied = set(scopes)
     for scope in scopes:
         parts = scope.split(':')
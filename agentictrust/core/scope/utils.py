@@ -12,5 +12,5 @@ def validate_scope_name(name: str) -> None:
     """
     Raises ValueError if the scope name does not follow the convention.
     """
-    if not SCOPE_PATTERN.match(name):
+    if not (isinstance(name, str) and SCOPE_PATTERN.match(name)):
         raise ValueError(f"Invalid scope format: {name}")
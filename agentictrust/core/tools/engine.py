@@ -58,14 +58,12 @@ class ToolEngine:
         # Get all tools first
         all_tools = Tool.list_all()
         
-        # Apply filters in memory
-        filtered_tools = all_tools
-        if category:
-            filtered_tools = [t for t in filtered_tools if t.category == category]
-        if is_active is not None:
-            filtered_tools = [t for t in filtered_tools if t.is_active == is_active]
-            
-        return [t.to_dict() for t in filtered_tools]
+        # Apply filters in memory, in a single pass
+        return [
+            t.to_dict() for t in all_tools
+            if (not category or t.category == category)
+            and (is_active is None or t.is_active == is_active)
+        ]
 
     def get_tool(self, tool_id: str) -> Dict[str, Any]:
         """Get a tool by ID with schema alias."""
@@ -194,7 +194,7 @@ class Agent(Base):
             if not agent:
                 logger.warning(f"Agent not found with ID: {client_id}")
                 raise ValueError(f"Agent not found with ID: {client_id}")
-            logger.debug(f"Retrieved agent: {client_id} - {agent.agent_name}")
+            logger.debug("Retrieved agent: {} - {}", client_id, agent.agent_name)
             return agent
         except SQLAlchemyError as e:
             err_msg = f"Database error retrieving agent with ID {client_id}: {str(e)}"
@@ -206,7 +206,7 @@ class Agent(Base):
         """List all agents."""
         try:
             agents = cls.query.all()
-            logger.debug(f"Retrieved {len(agents)} agents")
+            logger.debug("Retrieved {} agents", len(agents))
             return agents
         except SQLAlchemyError as e:
             err_msg = f"Database error retrieving all agents: {str(e)}"
@@ -258,7 +258,7 @@ class Agent(Base):
             if not agent:
                 logger.warning(f"No agent found with registration token: {registration_token[:10]}...")
                 raise ValueError(f"No agent found with the provided registration token")
-            logger.debug(f"Retrieved agent by registration token: {agent.client_id} - {agent.agent_name}")
+            logger.debug("Retrieved agent by registration token: {} - {}", agent.client_id, agent.agent_name)
             return agent
         except SQLAlchemyError as e:
             err_msg = f"Database error finding agent by registration token: {str(e)}"
@@ -2,6 +2,7 @@
 Task-related audit logging models.
 """
 import uuid
+from collections import deque
 from datetime import datetime
 from sqlalchemy import Column, String, JSON, ForeignKey
 from agentictrust.db.models.audit.audit_base import BaseAuditLog
@@ -18,8 +19,8 @@ class TaskAuditLog(BaseAuditLog):
     access_token_hash = Column(String(256), nullable=False)
     
     # Task context
-    task_id = Column(String(36), nullable=False)
-    parent_task_id = Column(String(36), nullable=True)
+    task_id = Column(String(36), nullable=False, index=True)
+    parent_task_id = Column(String(36), nullable=True, index=True)
     
     # Event details
     event_type = Column(String(50), nullable=False)
@@ -79,8 +80,6 @@ class TaskAuditLog(BaseAuditLog):
         in the IssuedToken model.
         """
         try:
-            import uuid
-            
             # Generate a special error token ID with a recognizable prefix
             error_token_id = f"error-{uuid.uuid4()}"
             
@@ -154,32 +153,31 @@ class TaskAuditLog(BaseAuditLog):
             return [task_id] if task_id else []
     
     @classmethod
-    def _find_root_task(cls, task_id, visited=None):
+    def _find_root_task(cls, task_id):
         """
         Find the root task by traversing upward through parent_task_id.
         """
-        if not visited:
-            visited = set()
-            
-        if task_id in visited:
-            # Circular reference detected, break the chain
-            logger.warning(f"Circular reference detected when finding root for task_id: {task_id}")
-            return task_id
-            
-        visited.add(task_id)
+        visited = set()
         
-        # Get the current task
-        task = cls.query.filter_by(task_id=task_id).first()
-        if not task:
-            logger.warning(f"Task not found for task_id: {task_id}")
-            return task_id
-            
-        # If no parent, this is the root
-        if not task.parent_task_id:
-            return task_id
+        while task_id not in visited:
+            visited.add(task_id)
             
-        # Otherwise, check parent
-        return cls._find_root_task(task.parent_task_id, visited)
+            # Only the parent link is needed to walk upward
+            task = cls.query.with_entities(cls.parent_task_id).filter_by(task_id=task_id).first()
+            if not task:
+                logger.warning(f"Task not found for task_id: {task_id}")
+                return task_id
+                
+            # If no parent, this is the root
+            if not task.parent_task_id:
+                return task_id
+                
+            # Otherwise, check parent
+            task_id = task.parent_task_id
+        
+        # Circular reference detected, break the chain
+        logger.warning(f"Circular reference detected when finding root for task_id: {task_id}")
+        return task_id
     
     @classmethod
     def _build_complete_chain(cls, root_task_id):
@@ -192,21 +190,23 @@ class TaskAuditLog(BaseAuditLog):
         task_chain = [root_task_id]  # Ordered list starting with root
         
         # Queue for breadth-first traversal
-        queue = [root_task_id]
+        queue = deque([root_task_id])
         visited = set([root_task_id])
         
         while queue:
-            current_task_id = queue.pop(0)
+            current_task_id = queue.popleft()
             
-            # Find all direct children of the current task
-            children = cls.query.filter_by(parent_task_id=current_task_id).all()
+            # Find the distinct ids of all direct children of the current task
+            children = cls.query.with_entities(cls.task_id).filter_by(
+                parent_task_id=current_task_id
+            ).distinct().all()
             
-            for child in children:
-                if child.task_id not in visited:
-                    visited.add(child.task_id)
-                    queue.append(child.task_id)
-                    all_tasks.add(child.task_id)
-                    task_chain.append(child.task_id)  # Add to ordered list
+            for (child_task_id,) in children:
+                if child_task_id not in visited:
+                    visited.add(child_task_id)
+                    queue.append(child_task_id)
+                    all_tasks.add(child_task_id)
+                    task_chain.append(child_task_id)  # Add to ordered list
         
         # Double check if we missed any related tasks
         # This catches tasks that might be related by reference but missing proper parent_task_id
@@ -168,7 +168,7 @@ class AuthorizationCode(Base):
             
         try:
             code_hash = cls._hash(code_plain)
-            logger.debug(f"Verifying authorization code for client: {client_id}")
+            logger.debug("Verifying authorization code for client: {}", client_id)
             
             row = (
                 db_session.query(cls)
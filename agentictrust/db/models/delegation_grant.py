@@ -14,7 +14,7 @@ class DelegationGrant(Base):
 
     grant_id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     principal_type = Column(Enum('user', 'agent', name='principal_type'), nullable=False)
-    principal_id = Column(String(36), nullable=False)
+    principal_id = Column(String(36), nullable=False, index=True)
     delegate_id = Column(String(36), nullable=False)  # agent.client_id
     scope = Column(JSON, nullable=False)  # list[str]
     constraints = Column(JSON, nullable=True)
@@ -193,7 +193,7 @@ class DelegationGrant(Base):
                 logger.warning(f"Delegation grant not found with ID: {grant_id}")
                 raise ValueError(f"Delegation grant not found with ID: {grant_id}")
                 
-            logger.debug(f"Retrieved delegation grant: {grant_id}")
+            logger.debug("Retrieved delegation grant: {}", grant_id)
             return grant
             
         except SQLAlchemyError as e:
@@ -221,7 +221,7 @@ class DelegationGrant(Base):
         """
         try:
             grants = cls.query.all()
-            logger.debug(f"Retrieved {len(grants)} delegation grants")
+            logger.debug("Retrieved {} delegation grants", len(grants))
             return grants
             
         except SQLAlchemyError as e:
@@ -316,7 +316,7 @@ class DelegationGrant(Base):
                 delegate_id=delegate_id
             ).all()
             
-            logger.debug(f"Found {len(grants)} delegation grants from {principal_type} {principal_id} to agent {delegate_id}")
+            logger.debug("Found {} delegation grants from {} {} to agent {}", len(grants), principal_type, principal_id, delegate_id)
             return grants
             
         except SQLAlchemyError as e:
@@ -358,9 +358,9 @@ class DelegationGrant(Base):
             grants = query.all()
             
             if active_only:
-                logger.debug(f"Found {len(grants)} active delegation grants for agent {delegate_id}")
+                logger.debug("Found {} active delegation grants for agent {}", len(grants), delegate_id)
             else:
-                logger.debug(f"Found {len(grants)} total delegation grants for agent {delegate_id}")
+                logger.debug("Found {} total delegation grants for agent {}", len(grants), delegate_id)
                 
             return grants
             
@@ -164,7 +164,7 @@ class Scope(Base):
             if not scope:
                 logger.warning(f"Scope not found with ID: {scope_id}")
                 raise ValueError(f"Scope not found with ID: {scope_id}")
-            logger.debug(f"Retrieved scope: {scope_id} - {scope.name}")
+            logger.debug("Retrieved scope: {} - {}", scope_id, scope.name)
             return scope
         except SQLAlchemyError as e:
             err_msg = f"Database error retrieving scope with ID {scope_id}: {str(e)}"
@@ -176,7 +176,7 @@ class Scope(Base):
         """List all scopes."""
         try:
             scopes = cls.query.all()
-            logger.debug(f"Retrieved {len(scopes)} scopes")
+            logger.debug("Retrieved {} scopes", len(scopes))
             return scopes
         except SQLAlchemyError as e:
             err_msg = f"Database error retrieving all scopes: {str(e)}"
@@ -234,9 +234,9 @@ class Scope(Base):
         try:
             scope = cls.query.filter_by(name=name).first()
             if scope:
-                logger.debug(f"Found scope by name: {name} (ID: {scope.scope_id})")
+                logger.debug("Found scope by name: {} (ID: {})", name, scope.scope_id)
             else:
-                logger.debug(f"No scope found with name: {name}")
+                logger.debug("No scope found with name: {}", name)
             return scope
         except SQLAlchemyError as e:
             err_msg = f"Database error finding scope by name '{name}': {str(e)}"
@@ -52,7 +52,7 @@ class IssuedToken(Base):
     parent_token_id = Column(String(36), ForeignKey('issued_tokens.token_id'), nullable=True)
     
     # Token context information
-    task_id = Column(String(36), nullable=False)
+    task_id = Column(String(36), nullable=False, index=True)
     parent_task_id = Column(String(36), nullable=True)
     task_description = Column(Text, nullable=True)
 
@@ -447,14 +447,12 @@ class IssuedToken(Base):
             Internal flag used by `revoke_children` to avoid duplicate audit
             logs when this method is invoked recursively.
         """
-        from datetime import datetime as _dt
-
         # If already revoked, nothing to do –
         if self.is_revoked:
             return
 
         self.is_revoked = True
-        self.revoked_at = _dt.utcnow()
+        self.revoked_at = datetime.utcnow()
         if reason:
             self.revocation_reason = reason
 
@@ -629,7 +627,7 @@ class IssuedToken(Base):
 
     def to_dict(self, include_children=False, include_parent=False):
         """Serialize the token object to a dictionary."""
-        logger.debug(f"Serializing token {self.token_id} to dict. Include children: {include_children}, include parent: {include_parent}")
+        logger.debug("Serializing token {} to dict. Include children: {}, include parent: {}", self.token_id, include_children, include_parent)
         try: # Wrap the serialization logic
             token_data = {
                 'token_id': self.token_id,
@@ -668,29 +666,29 @@ class IssuedToken(Base):
                 # Add calculated fields if useful
                 'is_valid': not self.is_revoked and (self.expires_at > datetime.utcnow() if self.expires_at else False)
             }
-            logger.debug(f"Base token data created for {self.token_id}")
+            logger.debug("Base token data created for {}", self.token_id)
 
             # Optionally include relationships (careful with recursion)
             if include_children:
-                logger.debug(f"Including child tokens for {self.token_id}")
+                logger.debug("Including child tokens for {}", self.token_id)
                 try:
                     # Handle potential lazy loading issues or recursion depth
                     token_data['child_tokens'] = [child.to_dict(include_children=False, include_parent=False) for child in self.child_tokens]
-                    logger.debug(f"Successfully serialized {len(token_data['child_tokens'])} child tokens for {self.token_id}")
+                    logger.debug("Successfully serialized {} child tokens for {}", len(token_data['child_tokens']), self.token_id)
                 except Exception as e:
                     logger.error(f"Error serializing child tokens for {self.token_id}: {e}", exc_info=True)
                     token_data['child_tokens'] = [] # Or some indicator of error/incompleteness
 
             if include_parent and self.parent_token:
-                logger.debug(f"Including parent token for {self.token_id}")
+                logger.debug("Including parent token for {}", self.token_id)
                 try:
                     token_data['parent_token'] = self.parent_token.to_dict(include_children=False, include_parent=False)
-                    logger.debug(f"Successfully serialized parent token for {self.token_id}")
+                    logger.debug("Successfully serialized parent token for {}", self.token_id)
                 except Exception as e:
                      logger.error(f"Error serializing parent token for {self.token_id}: {e}", exc_info=True)
                      token_data['parent_token'] = None
 
-            logger.debug(f"Finished serializing token {self.token_id}")
+            logger.debug("Finished serializing token {}", self.token_id)
             return token_data
         except Exception as e_dict: # Catch errors during serialization itself
             logger.error(f"Error within to_dict for token {self.token_id}: {e_dict}", exc_info=True)
@@ -165,7 +165,7 @@ class Tool(Base):
             if not tool:
                 logger.warning(f"Tool not found with ID: {tool_id}")
                 raise ValueError(f"Tool not found with ID: {tool_id}")
-            logger.debug(f"Retrieved tool: {tool_id} - {tool.name}")
+            logger.debug("Retrieved tool: {} - {}", tool_id, tool.name)
             return tool
         except SQLAlchemyError as e:
             err_msg = f"Database error retrieving tool with ID {tool_id}: {str(e)}"
@@ -177,7 +177,7 @@ class Tool(Base):
         """List all tools."""
         try:
             tools = cls.query.all()
-            logger.debug(f"Retrieved {len(tools)} tools")
+            logger.debug("Retrieved {} tools", len(tools))
             return tools
         except SQLAlchemyError as e:
             err_msg = f"Database error retrieving all tools: {str(e)}"
@@ -233,9 +233,9 @@ class Tool(Base):
         try:
             tool = cls.query.filter_by(name=name).first()
             if tool:
-                logger.debug(f"Found tool by name: {name} (ID: {tool.tool_id})")
+                logger.debug("Found tool by name: {} (ID: {})", name, tool.tool_id)
             else:
-                logger.debug(f"No tool found with name: {name}")
+                logger.debug("No tool found with name: {}", name)
             return tool
         except SQLAlchemyError as e:
             err_msg = f"Database error finding tool by name '{name}': {str(e)}"
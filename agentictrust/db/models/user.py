@@ -3,6 +3,7 @@ from datetime import datetime
 from sqlalchemy import Column, String, DateTime, Boolean, Table, ForeignKey, JSON
 from sqlalchemy.orm import relationship
 from agentictrust.db import Base, db_session
+from agentictrust.db.models.scope import Scope
 from agentictrust.utils.logger import logger
 
 # Association table for user-scope many-to-many relationship (policies now live in OPA only)
@@ -13,6 +14,13 @@ user_scopes = Table(
     Column('scope_id', String(36), ForeignKey('scopes.scope_id'), primary_key=True)
 )
 
+def _load_scopes(scope_ids):
+    """Fetch the given scopes in one query, keeping input order and skipping unknown IDs."""
+    if not scope_ids:
+        return []
+    found = {scope.scope_id: scope for scope in Scope.query.filter(Scope.scope_id.in_(scope_ids))}
+    return [found[scope_id] for scope_id in scope_ids if scope_id in found]
+
 class User(Base):
     """Model for users who can initiate agents and have assigned scopes/policies."""
     __tablename__ = 'users'
@@ -56,15 +64,11 @@ class User(Base):
             attributes=attributes or {}
         )
         if scope_ids:
-            from agentictrust.db.models.scope import Scope
-            for scope_id in scope_ids:
-                scope = Scope.query.get(scope_id)
-                if scope:
-                    user.scopes.append(scope)
+            user.scopes.extend(_load_scopes(scope_ids))
         try:
             db_session.add(user)
             db_session.commit()
-            logger.debug(f"Created user {user.user_id} with username {username}")
+            logger.debug("Created user {} with username {}", user.user_id, username)
         except Exception as e:
             logger.error(f"Error creating user: {e}")
             db_session.rollback()
@@ -75,12 +79,7 @@ class User(Base):
         """Update user attributes."""
         scope_ids = kwargs.pop('scope_ids', None)
         if scope_ids is not None:
-            self.scopes = []
-            from agentictrust.db.models.scope import Scope
-            for scope_id in scope_ids:
-                scope = Scope.query.get(scope_id)
-                if scope:
-                    self.scopes.append(scope)
+            self.scopes = _load_scopes(scope_ids)
         # Handle attributes merge
         attrs_update = kwargs.pop('attributes', None)
         if attrs_update is not None:
@@ -91,7 +90,7 @@ class User(Base):
         self.updated_at = datetime.utcnow()
         try:
             db_session.commit()
-            logger.debug(f"Updated user {self.user_id}")
+            logger.debug("Updated user {}", self.user_id)
         except Exception as e:
             logger.error(f"Error updating user: {e}")
             db_session.rollback()
@@ -138,7 +137,7 @@ class User(Base):
         try:
             db_session.delete(user)
             db_session.commit()
-            logger.debug(f"Deleted user {user_id}")
+            logger.debug("Deleted user {}", user_id)
         except Exception as e:
             logger.error(f"Error deleting user: {e}")
             db_session.rollback()
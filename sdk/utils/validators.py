@@ -80,19 +80,21 @@ def validate_string_list(
         return []
         
     if isinstance(value, str):
-        # Split space-separated string
-        return [s.strip() for s in value.split() if s.strip()]
+        # Split space-separated string (str.split() already drops empty items)
+        return value.split()
         
     if not isinstance(value, list):
         raise ValueError(f"{param_name} must be a list or string, got {type(value).__name__}")
         
-    # Validate each item is a string
+    # Validate each item is a string, stripping it only once
     result = []
+    append = result.append
     for i, item in enumerate(value):
         if not isinstance(item, str):
             raise ValueError(f"Item {i} in {param_name} must be a string, got {type(item).__name__}")
-        if item.strip():
-            result.append(item.strip())
+        item = item.strip()
+        if item:
+            append(item)
             
     return result
 
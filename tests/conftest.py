@@ -1,133 +1,187 @@
 """Pytest configuration and fixtures for tests."""
-import os
+import itertools
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from app.db import Base, db_session
-from app.db.models import User, Agent, Tool, Scope, Policy
-from app.core.users.engine import UserEngine
-from app.core.agents.engine import AgentEngine
-from app.core.tools.engine import ToolEngine
-from app.core.scope.engine import ScopeEngine
-from app.core.policy.engine import PolicyEngine
-from app.core.oauth.engine import OAuthEngine
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import StaticPool
+from agentictrust.db import Base, db_session
+from agentictrust.db.models import User, Agent, Tool, Scope
 
-@pytest.fixture(scope="session")
-def test_db():
-    """Create a test database in memory."""
-    # Use SQLite in-memory for tests
-    engine = create_engine("sqlite:///:memory:")
+def _build_test_engine():
+    """Create the in-memory test engine and its schema."""
+    # Keep the in-memory database on a single pooled connection so the
+    # schema lives as long as the engine does
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    
+    @event.listens_for(engine, "connect")
+    def _configure_sqlite(dbapi_connection, connection_record):
+        # pysqlite's own transaction handling breaks SAVEPOINTs; let
+        # SQLAlchemy emit BEGIN itself so per-test rollbacks work
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+    
     Base.metadata.create_all(engine)
+    return engine
+
+@pytest.fixture(scope="session")
+def _engine():
+    """Provide the shared in-memory test engine for the whole test session."""
+    engine = _build_test_engine()
+    
+    yield engine
     
-    # Create a new session factory
-    Session = sessionmaker(bind=engine)
+    engine.dispose()
+
+@pytest.fixture(scope="session")
+def _connection(_engine):
+    """Hold a single connection open for the whole test session."""
+    connection = _engine.connect()
+    original_bind = db_session.session_factory.kw.get("bind")
+    db_session.remove()
+    db_session.configure(bind=connection)
     
-    # Replace the db_session with our test session
-    original_session = db_session.registry()
-    db_session.configure(bind=engine)
+    yield connection
+    
+    # Teardown: restore original session binding
+    db_session.remove()
+    db_session.configure(bind=original_bind)
+    connection.close()
+
+@pytest.fixture
+def test_db(_connection):
+    """Run each test in a transaction that is rolled back afterwards."""
+    trans = _connection.begin()
+    
+    # Commits made by the code under test only release a SAVEPOINT, so
+    # rolling back the outer transaction undoes everything the test wrote
+    db_session.remove()
+    db_session.configure(bind=_connection, join_transaction_mode="create_savepoint")
     
-    # Setup done, yield control to the tests
     yield db_session
     
-    # Teardown: restore original session
-    db_session.configure(bind=original_session.bind)
+    db_session.remove()
+    trans.rollback()
+
+# Names only need to be unique within a run, so a counter is enough
+_suffix_counter = itertools.count()
 
 @pytest.fixture
+def unique_suffix():
+    """Provide a short suffix for names that must not collide across tests."""
+    return f"{next(_suffix_counter):08x}"
+
+@pytest.fixture(scope="session")
 def user_engine():
     """Provide a UserEngine instance."""
+    from agentictrust.core.users.engine import UserEngine
     return UserEngine()
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def agent_engine():
     """Provide an AgentEngine instance."""
+    from agentictrust.core.agents.engine import AgentEngine
     return AgentEngine()
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def tool_engine():
     """Provide a ToolEngine instance."""
+    from agentictrust.core.tools.engine import ToolEngine
     return ToolEngine()
 
-@pytest.fixture
-def scope_engine():
+@pytest.fixture(scope="session")
+def scope_engine(_connection):
     """Provide a ScopeEngine instance."""
-    return ScopeEngine()
-
-@pytest.fixture
-def policy_engine():
-    """Provide a PolicyEngine instance."""
-    return PolicyEngine()
+    from agentictrust.core.scope.engine import ScopeEngine
+    # Built outside any per-test transaction so the default scopes it seeds
+    # are not rolled back after the first test
+    engine = ScopeEngine()
+    # Release the transaction autobegun by reads after the seeding commit;
+    # test_db needs the connection idle to begin its own
+    db_session.remove()
+    return engine
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def oauth_engine():
     """Provide a OAuthEngine instance."""
+    from agentictrust.core.oauth.engine import OAuthEngine
     return OAuthEngine()
 
-@pytest.fixture
-def sample_scope(test_db):
-    """Create a sample scope for testing."""
-    scope = Scope.create(name="test:read", description="Test read scope")
-    yield scope
-    test_db.delete(scope)
-    test_db.commit()
+@pytest.fixture(scope="session")
+def _session_scope(_connection):
+    """Create the sample scope once, outside any per-test transaction."""
+    scope_id = Scope.create(name="test:read", description="Test read scope").scope_id
+    # Reading the expired ID autobegins a transaction; close it so test_db
+    # can begin its own on the shared connection
+    db_session.remove()
+    return scope_id
 
 @pytest.fixture
-def sample_policy(test_db):
-    """Create a sample policy for testing."""
-    policy = Policy.create(
-        name="test_policy", 
-        description="Test policy",
-        conditions={"environment": {"type": "test"}}
-    )
-    yield policy
-    test_db.delete(policy)
-    test_db.commit()
+def sample_scope(test_db, _session_scope):
+    """Provide the sample scope for testing."""
+    return test_db.get(Scope, _session_scope)
 
-@pytest.fixture
-def sample_user(test_db, sample_scope, sample_policy, user_engine):
-    """Create a sample user for testing."""
+@pytest.fixture(scope="session")
+def _session_user(_connection, _session_scope, user_engine):
+    """Create the sample user once, outside any per-test transaction."""
     user_data = user_engine.create_user(
         username="testuser",
         email="test@example.com",
         full_name="Test User",
-        scopes=[sample_scope.scope_id],
-        policies=[sample_policy.policy_id]
+        scopes=[_session_scope]
     )
-    user = User.get_by_id(user_data["user_id"])
-    yield user
-    try:
-        User.delete_by_id(user.user_id)
-    except:
-        pass
+    # Close the transaction autobegun by post-commit reads so test_db can
+    # begin its own on the shared connection
+    db_session.remove()
+    return user_data["user_id"]
 
 @pytest.fixture
-def sample_tool(test_db, sample_scope, tool_engine):
-    """Create a sample tool for testing."""
+def sample_user(test_db, _session_user):
+    """Provide the sample user for testing."""
+    return test_db.get(User, _session_user)
+
+@pytest.fixture(scope="session")
+def _session_tool(_connection, _session_scope, tool_engine):
+    """Create the sample tool once, outside any per-test transaction."""
     tool = tool_engine.create_tool_record(
         name="test_tool", 
         description="Test tool for testing",
         category="test",
-        permissions_required=[sample_scope.scope_id],
+        permissions_required=[_session_scope],
         parameters=[{"name": "param1", "type": "string", "required": True}]
     )
-    yield tool
-    try:
-        Tool.delete_by_id(tool.tool_id)
-    except:
-        pass
+    tool_id = tool.tool_id
+    db_session.remove()
+    return tool_id
 
 @pytest.fixture
-def sample_agent(test_db, agent_engine):
-    """Create a sample agent for testing."""
+def sample_tool(test_db, _session_tool):
+    """Provide the sample tool for testing."""
+    return test_db.get(Tool, _session_tool)
+
+@pytest.fixture(scope="session")
+def _session_agent(_connection, agent_engine):
+    """Register the sample agent once, outside any per-test transaction."""
     agent_data = agent_engine.register_agent(
         agent_name="test_agent",
         description="Test agent for testing",
         max_scope_level="restricted"
     )
-    agent = Agent.get_by_id(agent_data["agent"]["client_id"])
+    # Close the transaction autobegun by post-commit reads so test_db can
+    # begin its own on the shared connection
+    db_session.remove()
+    return agent_data["agent"]["client_id"], agent_data["credentials"]["client_secret"]
+
+@pytest.fixture
+def sample_agent(test_db, _session_agent):
+    """Provide the sample agent for testing."""
+    client_id, client_secret = _session_agent
+    agent = test_db.get(Agent, client_id)
     # Store the client secret for tests that need it
-    agent.test_client_secret = agent_data["credentials"]["client_secret"]
-    yield agent
-    try:
-        Agent.delete_by_id(agent.client_id)
-    except:
-        pass
+    agent.test_client_secret = client_secret
+    return agent
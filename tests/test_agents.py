@@ -1,6 +1,6 @@
 """End-to-end tests for agent management."""
 import pytest
-from app.db.models import Agent
+from agentictrust.db.models import Agent
 
 def test_register_agent(test_db, agent_engine):
     """Test registering a new agent."""
@@ -28,9 +28,6 @@ def test_register_agent(test_db, agent_engine):
     agent = Agent.get_by_id(agent_data["agent"]["client_id"])
     assert agent is not None
     assert agent.agent_name == "test_register_agent"
-    
-    # Clean up
-    Agent.delete_by_id(agent_data["agent"]["client_id"])
 
 def test_activate_agent(test_db, agent_engine):
     """Test activating an agent with a registration token."""
@@ -56,9 +53,6 @@ def test_activate_agent(test_db, agent_engine):
     agent = Agent.get_by_id(agent_data["agent"]["client_id"])
     assert agent.is_active is True
     assert agent.registration_token is None
-    
-    # Clean up
-    Agent.delete_by_id(agent_data["agent"]["client_id"])
 
 def test_get_agent(test_db, sample_agent, agent_engine):
     """Test getting an agent by client_id."""
@@ -75,7 +69,7 @@ def test_list_agents(test_db, sample_agent, agent_engine):
     agents = agent_engine.list_agents()
     
     # Verify sample agent is in the list
-    client_ids = [agent["client_id"] for agent in agents]
+    client_ids = {agent["client_id"] for agent in agents}
     assert sample_agent.client_id in client_ids
 
 def test_update_agent(test_db, sample_agent, agent_engine):
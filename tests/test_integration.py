@@ -1,34 +1,23 @@
 """Integration tests between users, agents, and tools."""
 import pytest
-from app.db.models import User, Agent, Tool, Scope, Policy
-from app.core.users.engine import UserEngine
-from app.core.agents.engine import AgentEngine
-from app.core.tools.engine import ToolEngine
+from agentictrust.db.models import User, Scope
 
 def test_end_to_end_workflow(test_db, user_engine, agent_engine, tool_engine):
     """Test the full workflow of creating users, agents, and tools and their interactions."""
     # Step 1: Create a scope for permissions
     scope = Scope.create(name="integration:data:read", description="Permission to read data")
     
-    # Step 2: Create a policy
-    policy = Policy.create(
-        name="basic_access", 
-        description="Basic access policy",
-        conditions={"user": {"department": "QA"}}
-    )
-    
-    # Step 3: Create a user with the scope and policy
+    # Step 2: Create a user with the scope
     user_data = user_engine.create_user(
         username="integration_user",
         email="integration@example.com",
         full_name="Integration Test User",
         department="QA",
-        scopes=[scope.scope_id],
-        policies=[policy.policy_id]
+        scopes=[scope.scope_id]
     )
     user_id = user_data["user_id"]
     
-    # Step 4: Create a tool requiring the scope
+    # Step 3: Create a tool requiring the scope
     tool = tool_engine.create_tool_record(
         name="data_retrieval_tool",
         description="Tool for retrieving data",
@@ -40,7 +29,7 @@ def test_end_to_end_workflow(test_db, user_engine, agent_engine, tool_engine):
         ]
     )
     
-    # Step 5: Register an agent
+    # Step 4: Register an agent
     agent_data = agent_engine.register_agent(
         agent_name="data_assistant",
         description="Agent for data retrieval",
@@ -48,10 +37,10 @@ def test_end_to_end_workflow(test_db, user_engine, agent_engine, tool_engine):
     )
     agent_id = agent_data["agent"]["client_id"]
     
-    # Step 6: Associate the tool with the agent
+    # Step 5: Associate the tool with the agent
     agent_engine.add_tool_to_agent(agent_id, tool.tool_id)
     
-    # Step 7: Activate the agent
+    # Step 6: Activate the agent
     registration_token = agent_data["credentials"]["registration_token"]
     agent_engine.activate_agent(registration_token)
     
@@ -68,16 +57,8 @@ def test_end_to_end_workflow(test_db, user_engine, agent_engine, tool_engine):
     
     # Get user to verify their scopes
     user = User.get_by_id(user_id)
-    user_scopes = [s.scope_id for s in user.scopes]
+    user_scopes = {s.scope_id for s in user.scopes}
     assert scope.scope_id in user_scopes
-    
-    # Clean up
-    Agent.delete_by_id(agent_id)
-    Tool.delete_by_id(tool.tool_id)
-    User.delete_by_id(user_id)
-    test_db.delete(policy)
-    test_db.delete(scope)
-    test_db.commit()
 
 def test_agent_with_multiple_tools(test_db, agent_engine, tool_engine, sample_scope):
     """Test an agent with multiple tools."""
@@ -124,11 +105,6 @@ def test_agent_with_multiple_tools(test_db, agent_engine, tool_engine, sample_sc
     agent_tools = agent_engine.get_agent_tools(agent_id)
     assert len(agent_tools) == 1
     assert agent_tools[0]["name"] == "multi_tool_1"
-    
-    # Clean up
-    Agent.delete_by_id(agent_id)
-    Tool.delete_by_id(tool1.tool_id)
-    Tool.delete_by_id(tool2.tool_id)
 
 def test_user_with_multiple_agents(test_db, user_engine, agent_engine):
     """Test scenario with a user having multiple agents."""
@@ -157,8 +133,3 @@ def test_user_with_multiple_agents(test_db, user_engine, agent_engine):
     updated_user = User.get_by_id(user_id)
     assert "agent_ids" in updated_user.attributes
     assert len(updated_user.attributes["agent_ids"]) == 2
-    
-    # Clean up
-    User.delete_by_id(user_id)
-    Agent.delete_by_id(agent1_data["agent"]["client_id"])
-    Agent.delete_by_id(agent2_data["agent"]["client_id"])
@@ -1,10 +1,7 @@
 """Tests for the refactored OAuthEngine."""
 import pytest
-import secrets
-from datetime import datetime, timedelta
-from app.db.models import Agent, IssuedToken
-from app.db.models.authorization_code import AuthorizationCode
-from app.core.oauth.utils import pkce_verify
+from agentictrust.db.models import Agent, IssuedToken
+from agentictrust.db.models.authorization_code import AuthorizationCode
 
 def test_create_authorization_code(test_db, oauth_engine):
     """Test creating an authorization code using the refactored OAuth engine."""
@@ -32,21 +29,12 @@ def test_create_authorization_code(test_db, oauth_engine):
     assert auth_code is not None
     assert auth_code.redirect_uri == redirect_uri
     assert auth_code.code_challenge == code_challenge
-    
-    # Clean up
-    db_codes = AuthorizationCode.query.filter_by(client_id=client_id).all()
-    for code in db_codes:
-        AuthorizationCode.query.filter_by(code_id=code.code_id).delete()
-    test_db.commit()
 
-def test_revoke_token(test_db, oauth_engine):
-    """Test revoking a token using the refactored OAuth engine."""
-    # Create an agent
-    agent_name = "test_revoke_agent"
-    agent, _ = Agent.create(agent_name=agent_name)
-    
-    # Create a token to revoke
-    token_obj, _, _ = IssuedToken.create(
+@pytest.fixture
+def issued_token(test_db, unique_suffix):
+    """Create an agent and a token issued to it."""
+    agent, _ = Agent.create(agent_name=f"test_token_agent_{unique_suffix}")
+    token_obj, access_token, _ = IssuedToken.create(
         client_id=agent.client_id,
         scope=["test:scope"],
         granted_tools=[],
@@ -58,6 +46,11 @@ def test_revoke_token(test_db, oauth_engine):
         delegator_sub="test-delegator",  # Adding required delegator_sub
         launch_reason="test"
     )
+    return agent, token_obj, access_token
+
+def test_revoke_token(test_db, oauth_engine, issued_token):
+    """Test revoking a token using the refactored OAuth engine."""
+    _, token_obj, _ = issued_token
     
     # Verify token is not revoked initially
     assert token_obj.is_revoked is False
@@ -66,33 +59,12 @@ def test_revoke_token(test_db, oauth_engine):
     oauth_engine.revoke(token_obj.token_id)
     
     # Verify token is now revoked
-    updated_token = IssuedToken.query.get(token_obj.token_id)
+    updated_token = test_db.get(IssuedToken, token_obj.token_id)
     assert updated_token.is_revoked is True
-    
-    # Clean up
-    test_db.delete(token_obj)
-    test_db.delete(agent)
-    test_db.commit()
 
-def test_introspect_token(test_db, oauth_engine):
+def test_introspect_token(test_db, oauth_engine, issued_token):
     """Test token introspection using the refactored OAuth engine."""
-    # Create an agent
-    agent_name = "test_introspect_agent"
-    agent, _ = Agent.create(agent_name=agent_name)
-    
-    # Create a token for introspection
-    token_obj, access_token, _ = IssuedToken.create(
-        client_id=agent.client_id,
-        scope=["test:scope"],
-        granted_tools=[],
-        task_id="test-task",
-        agent_instance_id=agent.client_id,
-        agent_type="test",
-        agent_model="test-model",
-        agent_provider="test-provider",
-        delegator_sub="test-delegator",  # Adding required delegator_sub
-        launch_reason="test"
-    )
+    agent, token_obj, access_token = issued_token
     
     # Introspect the token via engine
     introspected_token = oauth_engine.introspect(access_token)
@@ -101,8 +73,3 @@ def test_introspect_token(test_db, oauth_engine):
     assert introspected_token is not None
     assert introspected_token.token_id == token_obj.token_id
     assert introspected_token.client_id == agent.client_id
-    
-    # Clean up
-    test_db.delete(token_obj)
-    test_db.delete(agent)
-    test_db.commit()
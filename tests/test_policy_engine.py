@@ -1,196 +0,0 @@
-"""Tests for the refactored PolicyEngine."""
-import pytest
-import json
-import uuid
-from app.db.models import Policy, Scope
-
-def test_create_policy(test_db, policy_engine):
-    """Test creating a policy using the refactored policy engine."""
-    # Create a scope to use in the policy
-    scope = Scope.create(name="test:policy:scope", description="Test scope for policy")
-    
-    policy_name = "test_policy_creation"
-    policy_conditions = {"client_id": ["test-client"]}
-    
-    # Create a policy via the engine
-    policy_data = policy_engine.create_policy(
-        name=policy_name,
-        description="Test policy created via engine",
-        scopes=[scope.name],
-        effect="allow",
-        priority=5,
-        conditions=policy_conditions
-    )
-    
-    # Verify policy data
-    assert policy_data["name"] == policy_name
-    assert policy_data["effect"] == "allow"
-    assert policy_data["priority"] == 5
-    assert "conditions" in policy_data
-    assert len(policy_data["scopes"]) == 1
-    
-    # Verify policy exists in database
-    policy = Policy.query.filter_by(name=policy_name).first()
-    assert policy is not None
-    assert policy.effect == "allow"
-    assert len(policy.scopes) == 1
-    assert policy.scopes[0].name == scope.name
-    
-    # Clean up
-    Policy.delete_by_id(policy.policy_id)
-    Scope.delete_by_id(scope.scope_id)
-
-def test_get_policy(test_db, policy_engine):
-    """Test getting a policy using the refactored policy engine."""
-    # Create a scope and policy for testing
-    scope = Scope.create(name="test:get:policy:scope", description="Scope for testing get policy")
-    
-    policy = Policy.create(
-        name="test_get_policy",
-        conditions=json.dumps({"scopes": ["test:*"]}),
-        scope_ids=[scope.scope_id]
-    )
-    
-    # Get the policy via engine
-    policy_data = policy_engine.get_policy(policy.policy_id)
-    
-    # Verify data
-    assert policy_data["policy_id"] == policy.policy_id
-    assert policy_data["name"] == "test_get_policy"
-    assert len(policy_data["scopes"]) == 1
-    
-    # Clean up
-    Policy.delete_by_id(policy.policy_id)
-    Scope.delete_by_id(scope.scope_id)
-
-def test_update_policy(test_db, policy_engine):
-    """Test updating a policy using the refactored policy engine."""
-    
-    # Use unique names to avoid collisions from previous test runs
-    unique_id = str(uuid.uuid4())[:8]
-    scope1_name = f"test:update:policy:scope1:{unique_id}"
-    scope2_name = f"test:update:policy:scope2:{unique_id}"
-    policy_name = f"test_update_policy_{unique_id}"
-    
-    # Clean up any existing test data
-    try:
-        existing_scope1 = Scope.find_by_name(scope1_name)
-        if existing_scope1:
-            Scope.delete_by_id(existing_scope1.scope_id)
-        existing_scope2 = Scope.find_by_name(scope2_name)
-        if existing_scope2:
-            Scope.delete_by_id(existing_scope2.scope_id)
-    except Exception:
-        pass
-        
-    # Create scope and policy for testing
-    scope1 = Scope.create(name=scope1_name, description="Scope 1 for testing")
-    scope2 = Scope.create(name=scope2_name, description="Scope 2 for testing")
-    
-    policy = Policy.create(
-        name=policy_name,
-        description="Original description",
-        conditions=json.dumps({"client_id": ["original"]}),
-        scope_ids=[scope1.scope_id]
-    )
-    
-    # Update the policy via engine with just the description change
-    # to avoid issues with conditions handling in the tests
-    updated_data = policy_engine.update_policy(
-        policy_id=policy.policy_id,
-        data={
-            "description": "Updated description",
-            "scope_ids": [scope1.scope_id, scope2.scope_id]
-        }
-    )
-    
-    # Verify updated data from response
-    assert updated_data["description"] == "Updated description"
-    assert len(updated_data["scopes"]) == 2
-    
-    # Verify database was updated
-    policy_db = Policy.query.get(policy.policy_id)
-    assert policy_db.description == "Updated description"
-    assert len(policy_db.scopes) == 2
-    
-    # Clean up
-    Policy.delete_by_id(policy.policy_id)
-    Scope.delete_by_id(scope1.scope_id)
-    Scope.delete_by_id(scope2.scope_id)
-
-def test_delete_policy(test_db, policy_engine):
-    """Test deleting a policy using the refactored policy engine."""
-    # Create a policy to delete
-    policy = Policy.create(
-        name="test_delete_policy",
-        description="Test policy for deletion",
-        conditions=json.dumps({"test": True})
-    )
-    
-    # Verify it exists first
-    policy_id = policy.policy_id
-    found_policy = Policy.query.get(policy_id)
-    assert found_policy is not None
-    
-    # Delete the policy via engine
-    policy_engine.delete_policy(policy_id)
-    
-    # Verify it's gone
-    found_policy = Policy.query.get(policy_id)
-    assert found_policy is None
-
-def test_policy_evaluation(test_db, policy_engine):
-    """Test policy evaluation using the refactored policy engine."""
-    
-    # Use unique name to avoid collisions
-    unique_id = str(uuid.uuid4())[:8]
-    policy_name = f"test_eval_policy_{unique_id}"
-    
-    # Clean up any existing test data
-    try:
-        existing_policy = Policy.query.filter_by(name=policy_name).first()
-        if existing_policy:
-            Policy.delete_by_id(existing_policy.policy_id)
-    except Exception:
-        pass
-    
-    # Create a policy for testing evaluation
-    policy = Policy.create(
-        name=policy_name,
-        effect="allow",
-        priority=10,
-        conditions=json.dumps({"custom": {"client_id": ["test-client"]}})
-    )
-    
-    # Test matching context
-    matching_context = {
-        "client_id": "test-client",
-        "scopes": ["scope1", "scope2"]
-    }
-    
-    # Get the policy ID for assertion
-    policy_id = policy.policy_id
-    
-    result = policy_engine.evaluate(matching_context)
-    
-    # Check that our policy is working properly
-    if result["allowed"] and len(result["matched"]) > 0:
-        # Success case - our policy is in the matched list (or at least the evaluation passed)
-        assert result["decision"] == "allow"
-    else:
-        # There might be other policies that denied access, just check our policy was matched
-        assert policy_id in result["matched"]
-    
-    # Instead of testing for non-matching context which may vary due to other policies,
-    # just test that our specific policy ID is not in the matched list for a different client
-    non_matching_context = {
-        "client_id": "other-client",
-        "scopes": ["scope1", "scope2"]
-    }
-    
-    result = policy_engine.evaluate(non_matching_context)
-    # Only verify that our specific policy doesn't match
-    assert policy_id not in result["matched"]
-    
-    # Clean up
-    Policy.delete_by_id(policy.policy_id)
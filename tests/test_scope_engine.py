@@ -1,7 +1,6 @@
 """Tests for the refactored ScopeEngine."""
 import pytest
-from app.core.scope.engine import ScopeEngine
-from app.db.models import Scope
+from agentictrust.db.models import Scope
 
 def test_create_scope(test_db, scope_engine):
     """Test creating a scope using the refactored scope engine."""
@@ -29,9 +28,6 @@ def test_create_scope(test_db, scope_engine):
     scope = Scope.find_by_name(scope_name)
     assert scope is not None
     assert scope.description == scope_description
-    
-    # Clean up
-    Scope.delete_by_id(scope_data["scope_id"])
 
 def test_update_scope(test_db, scope_engine):
     """Test updating a scope using the refactored scope engine."""
@@ -62,9 +58,6 @@ def test_update_scope(test_db, scope_engine):
     assert updated_scope.description == "Updated description"
     assert updated_scope.is_sensitive is True
     assert updated_scope.category == "write"
-    
-    # Clean up
-    Scope.delete_by_id(scope.scope_id)
 
 def test_get_scope(test_db, scope_engine):
     """Test getting a scope using the refactored scope engine."""
@@ -81,15 +74,15 @@ def test_get_scope(test_db, scope_engine):
     assert scope_data["scope_id"] == scope.scope_id
     assert scope_data["name"] == "test:get:scope"
     assert scope_data["description"] == "Test scope for get method"
-    
-    # Clean up
-    Scope.delete_by_id(scope.scope_id)
 
 def test_list_scopes(test_db, scope_engine):
     """Test listing scopes using the refactored scope engine."""
     # Create test scopes with different categories
-    scope1 = Scope.create(name="test:list:read", description="Read scope", category="read")
-    scope2 = Scope.create(name="test:list:write", description="Write scope", category="write")
+    test_db.add_all([
+        Scope(name="test:list:read", description="Read scope", category="read"),
+        Scope(name="test:list:write", description="Write scope", category="write"),
+    ])
+    test_db.flush()
     
     # List all scopes
     all_scopes = scope_engine.list_scopes()
@@ -102,9 +95,24 @@ def test_list_scopes(test_db, scope_engine):
     assert len(test_read_scopes) == 1
     assert test_read_scopes[0]["name"] == "test:list:read"
     
-    # Clean up
-    Scope.delete_by_id(scope1.scope_id)
-    Scope.delete_by_id(scope2.scope_id)
+    # Iterate scopes lazily with the same filter
+    iter_names = {s["name"] for s in scope_engine.iter_scopes(level="read")}
+    assert "test:list:read" in iter_names
+    assert "test:list:write" not in iter_names
+
+def test_list_scopes_lite(test_db, scope_engine):
+    """Test listing selected scope fields as tuples."""
+    scope = Scope.create(name="test:lite:read", description="Lite scope", category="read")
+    
+    # Default fields are scope_id and name
+    assert (scope.scope_id, "test:lite:read") in scope_engine.list_scopes_lite()
+    
+    # Custom field selection
+    assert ("test:lite:read", "read") in scope_engine.list_scopes_lite(fields=("name", "category"))
+    
+    # Unknown fields are rejected
+    with pytest.raises(ValueError, match="Unknown scope fields"):
+        scope_engine.list_scopes_lite(fields=("not_a_field",))
 
 def test_delete_scope(test_db, scope_engine):
     """Test deleting a scope using the refactored scope engine."""
@@ -1,6 +1,6 @@
 """End-to-end tests for user management."""
 import pytest
-from app.db.models import User
+from agentictrust.db.models import User
 
 def test_create_user(test_db, user_engine):
     """Test creating a new user."""
@@ -19,9 +19,6 @@ def test_create_user(test_db, user_engine):
     user = User.get_by_id(user_data["user_id"])
     assert user is not None
     assert user.username == "newuser"
-    
-    # Clean up
-    User.delete_by_id(user_data["user_id"])
 
 def test_get_user(test_db, sample_user, user_engine):
     """Test getting a user by ID."""
@@ -39,7 +36,7 @@ def test_list_users(test_db, sample_user, user_engine):
     users = user_engine.list_users()
     
     # Verify sample user is in the list
-    user_ids = [user["user_id"] for user in users]
+    user_ids = {user["user_id"] for user in users}
     assert sample_user.user_id in user_ids
 
 def test_update_user(test_db, sample_user, user_engine):
@@ -79,33 +76,26 @@ def test_delete_user(test_db, user_engine):
     with pytest.raises(ValueError, match="User not found"):
         User.get_by_id(user_id)
 
-def test_user_with_scopes_and_policies(test_db, sample_scope, sample_policy, user_engine):
-    """Test creating and updating a user with scopes and policies."""
-    # Create user with scope and policy
+def test_user_with_scopes(test_db, sample_scope, user_engine):
+    """Test creating and updating a user with scopes."""
+    # Create user with scope
     user_data = user_engine.create_user(
         username="scopeuser",
         email="scope@example.com",
-        scopes=[sample_scope.scope_id],
-        policies=[sample_policy.policy_id]
+        scopes=[sample_scope.scope_id]
     )
     
-    # Verify scopes and policies were assigned
+    # Verify scopes were assigned
     user = User.get_by_id(user_data["user_id"])
     assert len(user.scopes) == 1
     assert user.scopes[0].scope_id == sample_scope.scope_id
-    assert len(user.policies) == 1
-    assert user.policies[0].policy_id == sample_policy.policy_id
     
-    # Update scopes and policies
+    # Update scopes
     user_engine.update_user(
         user.user_id,
-        {"scope_ids": [], "policy_ids": []}
+        {"scope_ids": []}
     )
     
-    # Verify scopes and policies were removed
+    # Verify scopes were removed
     user = User.get_by_id(user.user_id)
     assert len(user.scopes) == 0
-    assert len(user.policies) == 0
-    
-    # Clean up
-    User.delete_by_id(user.user_id)